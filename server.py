@@ -1,10 +1,18 @@
 import asyncio
 import datetime
+import logging
+import math
 import os
+import sys
+import time
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 import httpx
-from dateutil import parser
+import ijson
+import orjson
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 from fastmcp.server.auth.providers.bearer import BearerAuthProvider, RSAKeyPair
@@ -14,6 +22,8 @@ from mcp.types import INTERNAL_ERROR, INVALID_PARAMS
 from pydantic import BaseModel, Field
 from urllib.parse import urlparse
 
+logger = logging.getLogger(__name__)
+
 # --- Load environment variables ---
 load_dotenv()
 
@@ -24,6 +34,23 @@ GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
 assert TOKEN is not None, "Please set AUTH_TOKEN in your .env file"
 assert MY_NUMBER is not None, "Please set MY_NUMBER in your .env file"
 
+# --- Shared HTTP client (one connection pool for every tool call) ---
+CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+    timeout=10,
+    headers={"User-Agent": "Puch-MCP-DataFetcher/1.0"},
+)
+
+GITHUB_HEADERS = {"Accept": "application/vnd.github.v3+json"}
+# Add GitHub token if available to avoid rate limiting
+if GITHUB_TOKEN:
+    GITHUB_HEADERS["Authorization"] = f"token {GITHUB_TOKEN}"
+
+# --- LeetCode GraphQL query (minified once; sent verbatim on every request) ---
+LEETCODE_API_URL = "https://leetcode.com/graphql"
+LEETCODE_QUERY = "query getUserProfile($username:String!){matchedUser(username:$username){username profile{ranking reputation} submitStats:submitStatsGlobal{acSubmissionNum{difficulty count submissions}}}}"
+
 # --- Auth Provider ---
 class SimpleBearerAuthProvider(BearerAuthProvider):
     """A simple bearer token authentication provider."""
@@ -55,6 +82,101 @@ class LeetCodeProfileData(BaseModel):
     acceptance_rate: float
     ai_instruction: str
 
+# --- Response caches ---
+# GitHub entries are (fetched_at, etag, raw profile, data). Once stale, the profile is
+# revalidated with If-None-Match so an unchanged one costs a 304 instead of a download;
+# repo stats and day counts are always recomputed since they don't affect the profile ETag.
+GITHUB_CACHE_TTL = 300
+LEETCODE_CACHE_TTL = 60
+# Caches are keyed by caller-supplied usernames, so cap them; oldest writes are evicted first
+CACHE_MAX_ENTRIES = 1024
+GITHUB_CACHE: dict[str, tuple[float, str, dict, GitHubProfileData]] = {}
+LEETCODE_CACHE: dict[str, tuple[float, LeetCodeProfileData]] = {}
+GITHUB_PAGE_CONCURRENCY = 5
+# Repo stats cover at most this many pages (100 repos each) so huge accounts can't exhaust the rate limit
+GITHUB_MAX_REPO_PAGES = 10
+# One lock per (source, username) so concurrent identical requests share a single fetch;
+# FETCH_LOCK_USERS counts holders + waiters so idle locks can be dropped
+FETCH_LOCKS: dict[tuple[str, str], asyncio.Lock] = {}
+FETCH_LOCK_USERS: Counter[tuple[str, str]] = Counter()
+
+def _bounded_put(cache: dict, key, value) -> None:
+    """Stores key as the newest entry, evicting the oldest ones beyond CACHE_MAX_ENTRIES."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+@asynccontextmanager
+async def _fetch_lock(key: tuple[str, str]) -> AsyncIterator[None]:
+    """Serialises fetches for one key; the lock is discarded once nobody holds or awaits it."""
+    lock = FETCH_LOCKS.setdefault(key, asyncio.Lock())
+    FETCH_LOCK_USERS[key] += 1
+    try:
+        async with lock:
+            yield
+    finally:
+        FETCH_LOCK_USERS[key] -= 1
+        if not FETCH_LOCK_USERS[key]:
+            del FETCH_LOCK_USERS[key]
+            del FETCH_LOCKS[key]
+
+# --- Negative cache + circuit breaker ---
+# Unknown usernames are remembered for NOT_FOUND_TTL seconds. If an upstream returns
+# BREAKER_THRESHOLD 5xx responses within BREAKER_WINDOW seconds, calls to it fail fast
+# for BREAKER_COOLDOWN seconds instead of hammering it.
+NOT_FOUND_TTL = 300
+BREAKER_THRESHOLD = 5
+BREAKER_WINDOW = 30
+BREAKER_COOLDOWN = 10
+NOT_FOUND: dict[tuple[str, str], float] = {}
+FAIL_WINDOWS: dict[str, deque[float]] = {
+    "gh": deque(maxlen=BREAKER_THRESHOLD),
+    "lc": deque(maxlen=BREAKER_THRESHOLD),
+}
+UPSTREAM_NAMES = {"gh": "GitHub", "lc": "LeetCode"}
+
+def _check_upstream(source: str, key: str, username: str) -> None:
+    """Raises immediately for a recently-missing user or a tripped circuit breaker."""
+    now = time.monotonic()
+    missing_since = NOT_FOUND.get((source, key))
+    if missing_since is not None:
+        if now - missing_since < NOT_FOUND_TTL:
+            raise McpError(ErrorData(
+                code=INVALID_PARAMS,
+                message=f"User '{username}' not found on {UPSTREAM_NAMES[source]}.",
+            ))
+        del NOT_FOUND[(source, key)]
+
+    failures = FAIL_WINDOWS[source]
+    window_full = len(failures) == BREAKER_THRESHOLD and failures[-1] - failures[0] < BREAKER_WINDOW
+    if window_full and now - failures[-1] < BREAKER_COOLDOWN:
+        raise McpError(ErrorData(
+            code=INTERNAL_ERROR,
+            message=f"{UPSTREAM_NAMES[source]} API is failing repeatedly; try again in a few seconds.",
+        ))
+
+def _record_upstream_status(source: str, key: str, status_code: int, not_found: bool = False) -> None:
+    """Feeds an upstream response into the negative cache and circuit breaker.
+
+    `not_found` marks a missing user that the upstream reports without a 404 (LeetCode's GraphQL API).
+    """
+    now = time.monotonic()
+    if status_code == 404 or not_found:
+        # Entries are written in time order, so expired ones are always at the front
+        while NOT_FOUND:
+            oldest_key, oldest_at = next(iter(NOT_FOUND.items()))
+            if now - oldest_at < NOT_FOUND_TTL:
+                break
+            del NOT_FOUND[oldest_key]
+        _bounded_put(NOT_FOUND, (source, key), now)
+    elif status_code >= 500:
+        FAIL_WINDOWS[source].append(now)
+
+def _record_upstream_success(source: str) -> None:
+    """Closes the circuit breaker once a whole fetch (profile and any repo pages) has succeeded."""
+    FAIL_WINDOWS[source].clear()
+
 # --- MCP Server Setup (Updated Name) ---
 mcp = FastMCP(
     "Developer Profile Roaster MCP",
@@ -77,49 +199,88 @@ def _extract_username(username_or_url: str) -> str | None:
         except Exception: return None
     return cleaned_input
 
-# --- TOOL 1: GitHub Profile Data (Unchanged) ---
+# --- TOOL 1: GitHub Profile Data ---
 @mcp.tool
 async def get_github_profile_data(username_or_url: Annotated[str, Field(description="The GitHub username or full profile URL.")]) -> GitHubProfileData:
-    # ... (This entire function is the same as the previous version)
     username = _extract_username(username_or_url)
     if not username: raise McpError(ErrorData(code=INVALID_PARAMS, message="Invalid username or URL."))
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "User-Agent": "Puch-MCP-DataFetcher/1.0", 
-            "Accept": "application/vnd.github.v3+json"
-        }
-        
-        # Add GitHub token if available to avoid rate limiting
-        if GITHUB_TOKEN:
-            headers["Authorization"] = f"token {GITHUB_TOKEN}"
-        
-        try:
-            profile_task = client.get(f"https://api.github.com/users/{username}", headers=headers, timeout=10)
-            repos_task = client.get(f"https://api.github.com/users/{username}/repos?per_page=100", headers=headers, timeout=10)
-            responses = await asyncio.gather(profile_task, repos_task, return_exceptions=True)
-            profile_response, repos_response = responses
-            if isinstance(profile_response, Exception): raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Failed to fetch profile: {profile_response!r}"))
+    key = username.lower()
+    async with _fetch_lock(("gh", key)):
+        cached = GITHUB_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < GITHUB_CACHE_TTL:
+            return cached[3]
+        _check_upstream("gh", key, username)
+        etag, profile, data, complete = await _fetch_github_profile(username, (cached[1], cached[2]) if cached else None)
+        # Partial repo stats are served once but never cached, so the next call retries the failed pages
+        if complete:
+            _record_upstream_success("gh")
+            _bounded_put(GITHUB_CACHE, key, (time.monotonic(), etag, profile, data))
+        return data
+
+async def _fetch_github_profile(username: str, cached: tuple[str, dict] | None) -> tuple[str, dict, GitHubProfileData, bool]:
+    """Fetches a GitHub profile and its repo stats; `cached` is a prior (etag, raw profile) to revalidate.
+
+    The trailing bool is False when some repo pages failed and the stats are partial.
+    """
+    try:
+        profile_headers = {**GITHUB_HEADERS, "If-None-Match": cached[0]} if cached else GITHUB_HEADERS
+        profile_response = await CLIENT.get(f"https://api.github.com/users/{username}", headers=profile_headers)
+        _record_upstream_status("gh", username.lower(), profile_response.status_code)
+        if profile_response.status_code == 304 and cached: etag, profile = cached
+        else:
             if profile_response.status_code == 404: raise McpError(ErrorData(code=INVALID_PARAMS, message=f"User '{username}' not found on GitHub."))
             if profile_response.status_code != 200: raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"GitHub API returned {profile_response.status_code} for profile."))
-            profile = profile_response.json()
-            repos = []
-            if isinstance(repos_response, httpx.Response) and repos_response.status_code == 200: repos = repos_response.json()
-            public_repos = profile.get('public_repos', 0); followers = profile.get('followers', 0); twitter_username = profile.get('twitter_username')
-            total_stars = sum(repo.get('stargazers_count', 0) for repo in repos); fork_count = sum(1 for repo in repos if repo.get('fork', False))
-            lang_counts = {};
-            for repo in repos:
-                lang = repo.get('language')
-                if lang and lang != "null": lang_counts[lang] = lang_counts.get(lang, 0) + 1
-            top_languages = sorted(lang_counts, key=lang_counts.get, reverse=True)[:3]
-            created_date = parser.parse(profile.get('created_at', '')); account_age_days = (datetime.datetime.now(datetime.timezone.utc) - created_date).days
-            updated_date = parser.parse(profile.get('updated_at', '')); last_activity_days = (datetime.datetime.now(datetime.timezone.utc) - updated_date).days
-            github_stats_summary = (f"The GitHub user '{username}' has {public_repos} public repos with a total of {total_stars} stars, and {followers} followers. Their account is {account_age_days} days old.")
-            twitter_instruction = ""
-            if twitter_username: twitter_instruction = f"They also have a Twitter (X) account: @{twitter_username}. Make sure to roast them for probably posting cringe tech takes or having zero engagement there."
-            else: twitter_instruction = "They did not list a Twitter (X) account, so roast them for being out of the loop or afraid of public scrutiny."
-            instruction = (f"{github_stats_summary} {twitter_instruction} Based on all this data, perform the following two tasks. Part 1: Write a long, detailed, and brutal roast that combines both their GitHub and Twitter persona. Part 2: After the roast, provide a separate section titled 'Actionable Tips' with 3 concrete pieces of advice for improving their overall online developer presence.")
-            return GitHubProfileData(username=profile.get('login'), name=profile.get('name'), bio=profile.get('bio'), followers=followers, following=profile.get('following', 0), public_repos=public_repos, total_stars=total_stars, fork_count=fork_count, account_age_days=account_age_days, last_activity_days=last_activity_days, top_languages=top_languages, twitter_username=twitter_username, ai_instruction=instruction)
-        except httpx.HTTPError as e: raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"API connection failed: {e!r}"))
+            etag, profile = profile_response.headers.get("ETag", ""), orjson.loads(profile_response.content)
+        public_repos = int(profile.get('public_repos') or 0)
+
+        # Fan out the repo pages at once, at most GITHUB_PAGE_CONCURRENCY in flight.
+        # Each page is stream-parsed and folded into the totals without materialising the repo list.
+        # Once GitHub rate-limits one page, the pages still queued are skipped rather than sent.
+        sem = asyncio.Semaphore(GITHUB_PAGE_CONCURRENCY)
+        rate_limited = asyncio.Event()
+        total_stars = 0; fork_count = 0; skipped_pages = 0; lang_counts: Counter[str] = Counter()
+        async def aggregate_repo_page(page: int) -> None:
+            nonlocal total_stars, fork_count, skipped_pages
+            async with sem:
+                if rate_limited.is_set():
+                    skipped_pages += 1
+                    return
+                async with CLIENT.stream("GET", f"https://api.github.com/users/{username}/repos?per_page=100&page={page}", headers=GITHUB_HEADERS) as response:
+                    # Repo pages feed the circuit breaker too, so a failing /repos endpoint trips it
+                    _record_upstream_status("gh", username.lower(), response.status_code)
+                    if response.status_code in (403, 429):
+                        rate_limited.set()
+                    response.raise_for_status()
+                    repos = ijson.sendable_list(); repo_parser = ijson.items_coro(repos, 'item')
+                    async for chunk in response.aiter_bytes():
+                        repo_parser.send(chunk)
+                        for repo in repos:
+                            total_stars += repo.get('stargazers_count', 0)
+                            if repo.get('fork'): fork_count += 1
+                            lang = repo.get('language')
+                            if lang and lang != "null": lang_counts[lang] += 1
+                        del repos[:]
+                    repo_parser.close()
+        pages = min(math.ceil(public_repos / 100), GITHUB_MAX_REPO_PAGES)
+        results = await asyncio.gather(*(aggregate_repo_page(p) for p in range(1, pages + 1)), return_exceptions=True)
+        failed_pages = [(page, r) for page, r in enumerate(results, 1) if isinstance(r, BaseException)]
+        if failed_pages:
+            logger.warning(
+                "GitHub repo stats for '%s' are partial: %d of %d pages failed, %d skipped (first failure: page %d, %r)",
+                username, len(failed_pages), pages, skipped_pages, *failed_pages[0],
+            )
+        followers = int(profile.get('followers') or 0); twitter_username = profile.get('twitter_username')
+        top_languages = [name for name, _ in lang_counts.most_common(3)]
+        now = datetime.datetime.now(datetime.timezone.utc)
+        created_date = datetime.datetime.fromisoformat(profile['created_at'].replace('Z', '+00:00')); account_age_days = (now - created_date).days
+        updated_date = datetime.datetime.fromisoformat(profile['updated_at'].replace('Z', '+00:00')); last_activity_days = (now - updated_date).days
+        github_stats_summary = (f"The GitHub user '{username}' has {public_repos} public repos with a total of {total_stars} stars, and {followers} followers. Their account is {account_age_days} days old.")
+        twitter_instruction = ""
+        if twitter_username: twitter_instruction = f"They also have a Twitter (X) account: @{twitter_username}. Make sure to roast them for probably posting cringe tech takes or having zero engagement there."
+        else: twitter_instruction = "They did not list a Twitter (X) account, so roast them for being out of the loop or afraid of public scrutiny."
+        instruction = (f"{github_stats_summary} {twitter_instruction} Based on all this data, perform the following two tasks. Part 1: Write a long, detailed, and brutal roast that combines both their GitHub and Twitter persona. Part 2: After the roast, provide a separate section titled 'Actionable Tips' with 3 concrete pieces of advice for improving their overall online developer presence.")
+        return etag, profile, GitHubProfileData.model_construct(username=profile.get('login'), name=profile.get('name'), bio=profile.get('bio'), followers=followers, following=int(profile.get('following') or 0), public_repos=public_repos, total_stars=total_stars, fork_count=fork_count, account_age_days=account_age_days, last_activity_days=last_activity_days, top_languages=top_languages, twitter_username=twitter_username, ai_instruction=instruction), not (failed_pages or skipped_pages)
+    except httpx.HTTPError as e: raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"API connection failed: {e!r}"))
 
 # --- NEW TOOL 2: LeetCode Profile Data ---
 @mcp.tool
@@ -128,81 +289,93 @@ async def get_leetcode_profile_data(username: Annotated[str, Field(description="
     Fetches problem-solving stats for a given LeetCode user and includes
     a hardcoded instruction for the AI to roast them.
     """
-    api_url = "https://leetcode.com/graphql"
-    graphql_query = """
-    query getUserProfile($username: String!) {
-        matchedUser(username: $username) {
-            username
-            profile {
-                ranking
-                reputation
-            }
-            submitStats: submitStatsGlobal {
-                acSubmissionNum {
-                    difficulty
-                    count
-                    submissions
-                }
-            }
-        }
-    }
-    """
-    variables = {"username": username}
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(api_url, json={'query': graphql_query, 'variables': variables}, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json().get("data", {}).get("matchedUser")
-            if not data:
-                raise McpError(ErrorData(code=INVALID_PARAMS, message=f"User '{username}' not found on LeetCode."))
-
-            # Process the stats
-            profile_stats = data.get("profile", {})
-            submit_stats = data.get("submitStats", {}).get("acSubmissionNum", [])
-            
-            solved_all = next((s for s in submit_stats if s['difficulty'] == 'All'), {})
-            easy_solved = next((s for s in submit_stats if s['difficulty'] == 'Easy'), {})
-            medium_solved = next((s for s in submit_stats if s['difficulty'] == 'Medium'), {})
-            hard_solved = next((s for s in submit_stats if s['difficulty'] == 'Hard'), {})
-            
-            total_solved = solved_all.get('count', 0)
-            total_submissions = solved_all.get('submissions', 0)
-            acceptance_rate = round((total_solved / total_submissions) * 100, 2) if total_submissions > 0 else 0
-
-            # Create the hardcoded instruction for the AI
-            instruction = (
-                f"The LeetCode user '{username}' has a ranking of {profile_stats.get('ranking', 'N/A')} "
-                f"and has solved a total of {total_solved} problems ({easy_solved.get('count', 0)} Easy, "
-                f"{medium_solved.get('count', 0)} Medium, {hard_solved.get('count', 0)} Hard). "
-                f"Their overall acceptance rate is a pitiful {acceptance_rate}%. "
-                "Based on these stats, perform two tasks. "
-                "Part 1: Write a savage roast about their problem-solving skills, focusing on their acceptance rate and difficulty distribution. "
-                "Part 2: After the roast, give them a section called 'Grind Plan' with 3 actionable tips on how to actually get good at DSA."
-            )
-            
-            return LeetCodeProfileData(
-                username=data.get("username"),
-                ranking=profile_stats.get("ranking", 0),
-                reputation=profile_stats.get("reputation", 0),
-                total_problems_solved=total_solved,
-                easy_solved=easy_solved.get('count', 0),
-                medium_solved=medium_solved.get('count', 0),
-                hard_solved=hard_solved.get('count', 0),
-                acceptance_rate=acceptance_rate,
-                ai_instruction=instruction,
-            )
-        except httpx.HTTPStatusError as e:
-             raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"LeetCode API returned an error: {e.response.status_code}"))
-        except httpx.HTTPError as e:
-            raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Connection to LeetCode API failed: {e!r}"))
+    key = username.lower()
+    async with _fetch_lock(("lc", key)):
+        cached = LEETCODE_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < LEETCODE_CACHE_TTL:
+            return cached[1]
+        _check_upstream("lc", key, username)
+        data = await _fetch_leetcode_profile(username)
+        _record_upstream_success("lc")
+        _bounded_put(LEETCODE_CACHE, key, (time.monotonic(), data))
+        return data
+
+async def _fetch_leetcode_profile(username: str) -> LeetCodeProfileData:
+    """Fetches and summarises a LeetCode profile via the public GraphQL API."""
+    try:
+        response = await CLIENT.post(LEETCODE_API_URL, content=orjson.dumps({'query': LEETCODE_QUERY, 'variables': {'username': username}}), headers={'Content-Type': 'application/json'})
+        data = orjson.loads(response.content).get("data", {}).get("matchedUser") if response.is_success else None
+        _record_upstream_status("lc", username.lower(), response.status_code, not_found=response.is_success and not data)
+        response.raise_for_status()
+        
+        if not data:
+            raise McpError(ErrorData(code=INVALID_PARAMS, message=f"User '{username}' not found on LeetCode."))
+
+        # Process the stats
+        profile_stats = data.get("profile", {})
+        submit_stats = data.get("submitStats", {}).get("acSubmissionNum", [])
+        
+        by_diff = {s['difficulty']: s for s in submit_stats}
+        solved_all = by_diff.get('All', {})
+        easy_count = by_diff.get('Easy', {}).get('count', 0)
+        medium_count = by_diff.get('Medium', {}).get('count', 0)
+        hard_count = by_diff.get('Hard', {}).get('count', 0)
+        
+        total_solved = solved_all.get('count', 0)
+        total_submissions = solved_all.get('submissions', 0)
+        acceptance_rate = round((total_solved / total_submissions) * 100, 2) if total_submissions > 0 else 0
+
+        # Create the hardcoded instruction for the AI
+        instruction = (
+            f"The LeetCode user '{username}' has a ranking of {profile_stats.get('ranking', 'N/A')} "
+            f"and has solved a total of {total_solved} problems ({easy_count} Easy, "
+            f"{medium_count} Medium, {hard_count} Hard). "
+            f"Their overall acceptance rate is a pitiful {acceptance_rate}%. "
+            "Based on these stats, perform two tasks. "
+            "Part 1: Write a savage roast about their problem-solving skills, focusing on their acceptance rate and difficulty distribution. "
+            "Part 2: After the roast, give them a section called 'Grind Plan' with 3 actionable tips on how to actually get good at DSA."
+        )
+        
+        return LeetCodeProfileData.model_construct(
+            username=data.get("username"),
+            ranking=int(profile_stats.get("ranking") or 0),
+            reputation=int(profile_stats.get("reputation") or 0),
+            total_problems_solved=total_solved,
+            easy_solved=easy_count,
+            medium_solved=medium_count,
+            hard_solved=hard_count,
+            acceptance_rate=float(acceptance_rate),
+            ai_instruction=instruction,
+        )
+    except httpx.HTTPStatusError as e:
+         raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"LeetCode API returned an error: {e.response.status_code}"))
+    except httpx.HTTPError as e:
+        raise McpError(ErrorData(code=INTERNAL_ERROR, message=f"Connection to LeetCode API failed: {e!r}"))
 
 # --- Run MCP Server ---
+async def _warm_connection_pool() -> None:
+    """Opens connections up front so the first tool call skips DNS + TLS setup."""
+    await asyncio.gather(
+        CLIENT.head("https://api.github.com", headers=GITHUB_HEADERS),
+        CLIENT.head("https://leetcode.com"),
+        return_exceptions=True,
+    )
+
 async def main():
     """Starts the MCP server."""
     print("🚀 Starting Developer Profile Roaster MCP server on http://0.0.0.0:8086")
-    await mcp.run_async("streamable-http", host="0.0.0.0", port=8086)
+    # Warm up in the background so binding the port isn't held up by slow upstreams
+    warm_up = asyncio.create_task(_warm_connection_pool())
+    try:
+        await mcp.run_async("streamable-http", host="0.0.0.0", port=8086)
+    finally:
+        warm_up.cancel()
+        await CLIENT.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if sys.platform != "win32":
+        # uvloop is a drop-in, faster event loop for this I/O-bound server
+        import uvloop
+        uvloop.run(main())
+    else:
+        asyncio.run(main())